@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """
-Sync a challenge YAML file to CTFd.
+Sync challenge YAML files to CTFd.
 
-This script validates a challenge YAML file against the JSON Schema,
-then creates or updates the challenge via the CTFd API.
+This script validates each challenge YAML file against the JSON Schema,
+then creates or updates the challenge via the CTFd API. When several files
+are given, they are synced concurrently over a shared API session.
 
 When updating an existing challenge, the script compares the current remote
 state with the last pushed state. If a field was modified remotely (on CTFd),
 that field will NOT be overwritten, preserving remote changes.
 
 Usage:
-    python sync_challenge.py <path_to_challenge.yaml>
+    python sync_challenge.py <path_to_challenge.yaml> [<path_to_challenge.yaml> ...]
 
 Environment variables or modify the configuration below:
     CTFD_URL: Base URL of the CTFd instance (e.g., http://localhost:4000)
@@ -18,23 +19,108 @@ Environment variables or modify the configuration below:
 """
 
 import argparse
+import functools
 import hashlib
 import json
+import mmap
 import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
-import jsonschema
-import requests
 import yaml
 
+# requests, jsonschema and the compiled schema validators are imported where
+# they're first needed, so --help and dry runs that pass the compiled schema
+# check don't pay to import them
+if TYPE_CHECKING:
+    import jsonschema
+
+# Use the LibYAML-backed loader when PyYAML was built with it (the binary
+# wheels are); otherwise fall back to the pure-Python implementation.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# orjson is optional. It's a much faster drop-in for the json module when
+# reading state files and API responses and writing API payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-CTFD_URL = os.environ.get("CTFD_URL", "http://localhost:4000")
-CTFD_API_TOKEN = os.environ.get("CTFD_API_TOKEN", "")
+# Used when CTFD_URL is not set
+DEFAULT_CTFD_URL = "http://localhost:4000"
+
+# Connection pool size and retry budget for the CTFd API session. The pool
+# size is also the ceiling for --jobs, so concurrent syncs never wait on a
+# connection.
+HTTP_POOL_SIZE = 64
+HTTP_RETRIES = 5
+
+# Number of challenges synced concurrently when several files are given
+SYNC_WORKERS = 8
+
+# Challenge files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Tuple[str, str]:
+    """
+    Get the CTFd URL and API token from the environment.
+
+    The environment is read on first use rather than at import time.
+
+    Returns:
+        Tuple of (CTFd URL, API token)
+    """
+    return (
+        os.environ.get("CTFD_URL", DEFAULT_CTFD_URL),
+        os.environ.get("CTFD_API_TOKEN", ""),
+    )
+
+
+# =============================================================================
+# JSON HELPERS
+# =============================================================================
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes with sorted keys.
+
+    Pretty output is what state files are written with. It always goes through
+    the json module with non-ASCII characters escaped, exactly as the state
+    files have always been written, so committed files don't churn.
+    """
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=True).encode("ascii")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    text = json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, memoryview]) -> Any:
+    """
+    Parse JSON from bytes or a buffer such as a memoryview.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+    the latter regardless of which parser is in use.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
 
 # =============================================================================
 # JSON SCHEMA DEFINITION
@@ -142,6 +228,88 @@ CHALLENGE_JSON_SCHEMA = {
     },
 }
 
+# URI the challenge schema is registered under for $ref resolution
+CHALLENGE_SCHEMA_URI = "urn:ctfd:challenge"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> "jsonschema.Draft202012Validator":
+    """
+    Check the schema and build the jsonschema validator.
+
+    Built on first use and then reused for every challenge, rather than
+    recompiling the schema on each validation. The schema is registered in
+    a pre-crawled referencing registry, so $refs are resolved against it
+    without any per-validation lookups.
+    """
+    import jsonschema
+
+    # referencing ships with jsonschema (4.18+)
+    from referencing import Registry, Resource
+
+    jsonschema.Draft202012Validator.check_schema(CHALLENGE_JSON_SCHEMA)
+    registry = Registry().with_resource(
+        CHALLENGE_SCHEMA_URI, Resource.from_contents(CHALLENGE_JSON_SCHEMA)
+    )
+    return jsonschema.Draft202012Validator(CHALLENGE_JSON_SCHEMA, registry=registry.crawl())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_batch_validator() -> "jsonschema.Draft202012Validator":
+    """
+    Build a validator for an array of challenges.
+
+    It shares the challenge validator's registry, so a whole batch of
+    challenges is checked with a single iter_errors call.
+    """
+    return _get_validator().evolve(schema={"type": "array", "items": CHALLENGE_JSON_SCHEMA})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fast_check() -> Optional[Callable[[Any], bool]]:
+    """
+    Build a compiled validity check for the challenge schema, if a compiled
+    validator library is installed.
+
+    jsonschema-rs (Rust) is preferred since it implements draft 2020-12
+    natively; fastjsonschema (generated Python code) is the fallback. Both are
+    optional and, like the jsonschema validator, imported and built on first
+    use, so fastjsonschema is never imported when jsonschema-rs is installed.
+    """
+    try:
+        import jsonschema_rs
+    except ImportError:
+        pass
+    else:
+        rs_is_valid = jsonschema_rs.Draft202012Validator(CHALLENGE_JSON_SCHEMA).is_valid
+
+        def is_valid(data: Any) -> bool:
+            # jsonschema-rs raises ValueError for YAML values JSON has no type
+            # for (dates, binary, sets, non-string keys); they're never valid
+            try:
+                return rs_is_valid(data)
+            except ValueError:
+                return False
+
+        return is_valid
+
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+
+    # use_default=False stops fastjsonschema from filling schema defaults into the data
+    validate = fastjsonschema.compile(CHALLENGE_JSON_SCHEMA, use_default=False)
+
+    def is_valid(data: Any) -> bool:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return is_valid
+
 
 class ValidationError(Exception):
     """Raised when YAML validation fails."""
@@ -149,6 +317,14 @@ class ValidationError(Exception):
     pass
 
 
+class APIError(Exception):
+    """Raised when the CTFd API returns an error response."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 def validate_challenge_yaml(data: Dict) -> List[str]:
     """
     Validate challenge data against the JSON Schema.
@@ -159,30 +335,105 @@ def validate_challenge_yaml(data: Dict) -> List[str]:
     Returns:
         List of validation errors (empty if valid)
     """
-    errors = []
-    validator = jsonschema.Draft202012Validator(CHALLENGE_JSON_SCHEMA)
+    # Invalid challenges still go through jsonschema so the reported errors are
+    # complete and worded the same whichever fast path is installed
+    fast_is_valid = _get_fast_check()
+    if fast_is_valid is not None and fast_is_valid(data):
+        return []
 
-    for error in validator.iter_errors(data):
-        # Format the error message nicely
-        path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
-        if path == "root":
-            errors.append(error.message)
-        else:
-            errors.append(f"{path}: {error.message}")
+    return [
+        _format_error(error.absolute_path, error.message)
+        for error in _get_validator().iter_errors(data)
+    ]
+
+
+def validate_many(datas: List[Any]) -> List[List[str]]:
+    """
+    Validate several challenges against the JSON Schema in one pass.
+
+    Args:
+        datas: Parsed YAML data for each challenge
+
+    Returns:
+        List of validation errors for each challenge, in the same order
+    """
+    errors: List[List[str]] = [[] for _ in datas]
+
+    fast_is_valid = _get_fast_check()
+    if fast_is_valid is None:
+        invalid = list(range(len(datas)))
+    else:
+        invalid = [i for i, data in enumerate(datas) if not fast_is_valid(data)]
+    if not invalid:
+        return errors
+
+    # Errors are bucketed back to their challenge by the first path element,
+    # which is the challenge's index in the batch
+    batch = [datas[i] for i in invalid]
+    for error in _get_batch_validator().iter_errors(batch):
+        index, *path = error.absolute_path
+        errors[invalid[index]].append(_format_error(path, error.message))
 
     return errors
 
 
+def _format_error(path: Sequence[Any], message: str) -> str:
+    """Format a validation error message, prefixed with its path in the data."""
+    if not path:
+        return message
+    return f"{'.'.join(str(p) for p in path)}: {message}"
+
+
 # =============================================================================
 # API CLIENT
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _get_retry_class() -> type:
+    """
+    Build the urllib3 Retry policy used by the API session.
+
+    POST isn't in allowed_methods, so it is never replayed after a 5xx or a
+    read error, either of which may come after CTFd created the challenge. A
+    429, or a 503 with Retry-After, means CTFd throttled the request without
+    processing it, so a POST is replayed in those cases only.
+    """
+    from urllib3.util.retry import Retry
+
+    class ThrottleRetry(Retry):
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            if method.upper() == "POST":
+                return bool(
+                    self.total
+                    and self.respect_retry_after_header
+                    and (status_code == 429 or (status_code == 503 and has_retry_after))
+                )
+            return super().is_retry(method, status_code, has_retry_after)
+
+    return ThrottleRetry
+
+
 class CTFdAPIClient:
     """Client for interacting with the CTFd API."""
 
-    def __init__(self, base_url: str, api_token: str):
+    def __init__(self, base_url: str, api_token: str, index_names: bool = False):
+        """
+        Args:
+            base_url: Base URL of the CTFd instance
+            api_token: API token for authentication
+            index_names: If True, fetch every challenge on the first lookup by
+                name and answer later lookups from that index. This saves a
+                request per challenge when syncing many at once.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
         self.base_url = base_url.rstrip("/")
+        self.index_names = index_names
+        self._name_index: Optional[Dict[str, Dict]] = None
+        self._name_index_lock = threading.Lock()
+        self._name_locks: Dict[str, threading.Lock] = {}
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -190,22 +441,45 @@ class CTFdAPIClient:
                 "Content-Type": "application/json",
             }
         )
+        # Keep connections alive across requests and retry transient failures,
+        # waiting as long as CTFd asks via Retry-After when it throttles us.
+        # PATCH sets absolute field values, so replaying it is safe; POST is
+        # only replayed when CTFd throttled it (see _get_retry_class), since a
+        # create that reached CTFd would be duplicated.
+        retry_class = _get_retry_class()
+        retry = retry_class(
+            total=HTTP_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=retry_class.DEFAULT_ALLOWED_METHODS | {"PATCH"},
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make an API request."""
         url = f"{self.base_url}/api/v1/{endpoint.lstrip('/')}"
         response = self.session.request(method, url, **kwargs)
 
+        if response.status_code == 204:
+            return {}
+
         try:
-            data = response.json()
-        except requests.exceptions.JSONDecodeError:
-            raise Exception(
-                f"Invalid JSON response from API: {response.status_code} {response.text[:200]}"
+            data = _json_loads(response.content)
+        except json.JSONDecodeError:
+            raise APIError(
+                response.status_code,
+                f"Invalid JSON response from API: {response.status_code} {response.text[:200]}",
             )
 
         if not response.ok:
             errors = data.get("errors", data.get("message", "Unknown error"))
-            raise Exception(f"API error ({response.status_code}): {errors}")
+            raise APIError(response.status_code, f"API error ({response.status_code}): {errors}")
 
         return data
 
@@ -224,21 +498,45 @@ class CTFdAPIClient:
 
     def create_challenge(self, data: Dict) -> Dict:
         """Create a new challenge."""
-        response = self._request("POST", "/challenges", json=data)
-        return response.get("data", {})
+        response = self._request("POST", "/challenges", data=_json_dumps(data))
+        challenge = response.get("data", {})
+        if self._name_index is not None:
+            self._name_index.setdefault(challenge.get("name"), challenge)
+        return challenge
 
     def update_challenge(self, challenge_id: int, data: Dict) -> Dict:
         """Update an existing challenge."""
-        response = self._request("PATCH", f"/challenges/{challenge_id}", json=data)
+        response = self._request("PATCH", f"/challenges/{challenge_id}", data=_json_dumps(data))
         return response.get("data", {})
 
+    def _get_name_index(self) -> Dict[str, Dict]:
+        """Get every challenge by name, fetching them on first use."""
+        with self._name_index_lock:
+            if self._name_index is None:
+                index = {}
+                for challenge in self.get_challenges():
+                    index.setdefault(challenge.get("name"), challenge)
+                self._name_index = index
+            return self._name_index
+
+    def lock_name(self, name: str) -> threading.Lock:
+        """
+        Get the lock for a challenge name.
+
+        Holding it across the lookup and the create or update keeps concurrent
+        syncs of the same challenge from both creating it.
+        """
+        # dict.setdefault is atomic, so concurrent callers get the same lock
+        return self._name_locks.setdefault(name, threading.Lock())
+
     def find_challenge_by_name(self, name: str) -> Optional[Dict]:
         """Find a challenge by exact name match."""
+        if self.index_names:
+            return self._get_name_index().get(name)
+        # CTFd's name filter is already an exact match, so the first row is
+        # normally the one; the check guards against servers that ignore it
         challenges = self.get_challenges(name=name)
-        for challenge in challenges:
-            if challenge.get("name") == name:
-                return challenge
-        return None
+        return next((c for c in challenges if c.get("name") == name), None)
 
 
 # =============================================================================
@@ -246,24 +544,48 @@ class CTFdAPIClient:
 # =============================================================================
 
 # Fields that are tracked for remote modification detection
-TRACKED_FIELDS = {
-    "name",
-    "category",
-    "description",
-    "attribution",
-    "connection_info",
-    "type",
-    "state",
-    "value",
-    "max_attempts",
-    "next_id",
-    "logic",
-    "initial",
-    "minimum",
-    "decay",
-    "function",
-    "requirements",
-}
+TRACKED_FIELDS = frozenset(
+    {
+        "name",
+        "category",
+        "description",
+        "attribution",
+        "connection_info",
+        "type",
+        "state",
+        "value",
+        "max_attempts",
+        "next_id",
+        "logic",
+        "initial",
+        "minimum",
+        "decay",
+        "function",
+        "requirements",
+    }
+)
+
+# Fields that are never sent in an update payload
+READ_ONLY_FIELDS = frozenset({"id"})
+
+
+class _SafeNameTable(dict):
+    """
+    str.translate table that keeps alphanumerics, '-' and '_' and maps every
+    other character to '_'.
+
+    Entries are filled in on first lookup, so each distinct character is
+    classified once and later translations run entirely in C.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        mapped = char if char.isalnum() or char in "-_" else "_"
+        self[codepoint] = mapped
+        return mapped
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
 
 
 def get_state_dir(yaml_path: Path) -> Path:
@@ -271,43 +593,83 @@ def get_state_dir(yaml_path: Path) -> Path:
     return yaml_path.parent / ".sync_state"
 
 
+@functools.lru_cache(maxsize=1024)
 def get_state_file_path(yaml_path: Path, challenge_name: str) -> Path:
     """
     Get the path to the state file for a challenge.
 
     Uses a hash of the challenge name to avoid filesystem issues with special characters.
+    Results are memoized since each sync looks the path up several times.
     """
     state_dir = get_state_dir(yaml_path)
-    # Use hash to handle special characters in challenge names
-    name_hash = hashlib.sha256(challenge_name.encode()).hexdigest()[:16]
+    # Use hash to handle special characters in challenge names. The digest only
+    # needs to be stable (existing state files are keyed by it), not secure.
+    name_hash = hashlib.sha256(challenge_name.encode(), usedforsecurity=False).hexdigest()[:16]
     # Also include a sanitized version of the name for readability
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in challenge_name)[:50]
+    safe_name = challenge_name.translate(_SAFE_NAME_TABLE)[:50]
     return state_dir / f"{safe_name}_{name_hash}.json"
 
 
-def load_last_pushed_state(yaml_path: Path, challenge_name: str) -> Optional[Dict]:
+def load_last_pushed_state(
+    yaml_path: Path, challenge_name: str, log: Callable[[str], None] = print
+) -> Optional[Dict]:
     """
     Load the last pushed state for a challenge.
 
-    Returns None if no state file exists.
+    Returns None if no state file exists. Warnings about unreadable state
+    files are emitted through ``log``.
     """
     state_file = get_state_file_path(yaml_path, challenge_name)
-    if not state_file.exists():
-        return None
 
     try:
-        with open(state_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(state_file, "rb") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, IOError) as e:
-        print(f"Warning: Could not load state file {state_file}: {e}")
+        log(f"Warning: Could not load state file {state_file}: {e}")
         return None
 
 
-def save_pushed_state(yaml_path: Path, challenge_name: str, state: Dict) -> None:
+def compute_content_hash(data: Dict) -> str:
+    """
+    Compute a canonical hash of local challenge data.
+
+    Keys are sorted before hashing, so the hash doesn't depend on the order
+    of fields in the YAML file.
+    """
+    return hashlib.blake2b(_json_dumps(data), digest_size=16).hexdigest()
+
+
+def compute_url_digest(ctfd_url: str) -> str:
+    """
+    Compute a short digest identifying a CTFd instance by its base URL.
+
+    State files are committed and the URL may be private (CI keeps CTFD_URL
+    as a secret), so only this digest is ever written to them.
+    """
+    return hashlib.blake2b(ctfd_url.encode(), digest_size=8).hexdigest()
+
+
+def save_pushed_state(
+    yaml_path: Path,
+    challenge_name: str,
+    state: Dict,
+    content_hash: Optional[str] = None,
+    ctfd_url: Optional[str] = None,
+) -> None:
     """
     Save the pushed state for a challenge.
 
-    Only saves the tracked fields that matter for comparison.
+    Only saves the tracked fields that matter for comparison, plus the challenge
+    ID so the next sync can fetch the challenge without looking it up by name.
+
+    Args:
+        yaml_path: Path to the challenge YAML file
+        challenge_name: Name of the challenge
+        state: Challenge state after the push
+        content_hash: Hash of the local data, if all of it was pushed
+        ctfd_url: Base URL of the CTFd instance the challenge was pushed to
     """
     state_dir = get_state_dir(yaml_path)
     state_dir.mkdir(exist_ok=True)
@@ -316,9 +678,94 @@ def save_pushed_state(yaml_path: Path, challenge_name: str, state: Dict) -> None
 
     # Only save tracked fields
     filtered_state = {k: v for k, v in state.items() if k in TRACKED_FIELDS}
+    if state.get("id") is not None:
+        filtered_state["id"] = state["id"]
+    if content_hash is not None:
+        filtered_state["_hash"] = content_hash
+    if ctfd_url is not None:
+        filtered_state["_ctfd"] = compute_url_digest(ctfd_url)
+
+    with open(state_file, "wb") as f:
+        f.write(_json_dumps(filtered_state, pretty=True))
+
+
+def is_pushed_state_current(
+    last_pushed_state: Optional[Dict], content_hash: str, ctfd_url: str
+) -> bool:
+    """
+    Check whether the last push was of this exact local data to this CTFd instance.
+
+    State files are committed alongside the challenges, so a push to one CTFd
+    instance must not make another instance look up to date.
+    """
+    return (
+        last_pushed_state is not None
+        and last_pushed_state.get("_hash") == content_hash
+        and last_pushed_state.get("_ctfd") == compute_url_digest(ctfd_url)
+    )
+
+
+def get_cache_file_path(yaml_path: Path) -> Path:
+    """
+    Get the path to the local sync cache entry for a challenge file.
+
+    Unlike the sync state, the cache holds machine-local data (file
+    modification times), so it lives in its own directory that git ignores.
+    """
+    return yaml_path.parent / ".sync_cache" / f"{yaml_path.name}.json"
+
+
+def load_sync_cache(yaml_path: Path, mtime_ns: Optional[int]) -> Optional[Dict]:
+    """
+    Load the sync cache entry for a challenge file, if the file is unchanged.
+
+    Returns None unless the entry was recorded for the file's current
+    modification time. A missing, unreadable or malformed entry is never an
+    error.
+    """
+    if mtime_ns is None:
+        return None
+
+    try:
+        with open(get_cache_file_path(yaml_path), "rb") as f:
+            entry = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get("mtime_ns") != mtime_ns
+        or not isinstance(entry.get("name"), str)
+    ):
+        return None
+    return entry
+
+
+def save_sync_cache(
+    yaml_path: Path, mtime_ns: Optional[int], data: Dict, content_hash: str
+) -> None:
+    """
+    Record that a challenge file, as of `mtime_ns`, was fully pushed.
+
+    The entry keeps what the next sync needs to check CTFd without loading the
+    file: the challenge name, its fields and the hash of its data.
+    """
+    if mtime_ns is None:
+        return
+
+    cache_file = get_cache_file_path(yaml_path)
+    if not cache_file.parent.is_dir():
+        cache_file.parent.mkdir(exist_ok=True)
+        (cache_file.parent / ".gitignore").write_text("*\n")
 
-    with open(state_file, "w", encoding="utf-8") as f:
-        json.dump(filtered_state, f, indent=2, sort_keys=True)
+    entry = {
+        "mtime_ns": mtime_ns,
+        "name": data["name"],
+        "fields": sorted(data),
+        "hash": content_hash,
+    }
+    with open(cache_file, "wb") as f:
+        f.write(_json_dumps(entry))
 
 
 def normalize_value(value: Any) -> Any:
@@ -356,20 +803,28 @@ def detect_remotely_modified_fields(
         # No previous state - cannot detect remote modifications
         return set(), {}
 
-    remotely_modified = set()
-    modifications = {}
-
-    for field in TRACKED_FIELDS:
-        if field not in local_data:
-            # We're not trying to update this field, so skip it
-            continue
-
-        remote_value = normalize_value(remote_state.get(field))
-        last_pushed_value = normalize_value(last_pushed_state.get(field))
-
-        if remote_value != last_pushed_value:
-            remotely_modified.add(field)
-            modifications[field] = (remote_value, last_pushed_value)
+    # Only fields we're trying to update are of interest. Fields CTFd doesn't
+    # return (requirements isn't part of a challenge read) can't have changed
+    # as far as we can tell.
+    fields = local_data.keys() & TRACKED_FIELDS & remote_state.keys()
+    remote = {field: normalize_value(remote_state.get(field)) for field in fields}
+    last_pushed = {field: normalize_value(last_pushed_state.get(field)) for field in fields}
+
+    # Scalar fields are compared all at once as sets of (field, value) pairs;
+    # only lists and dicts, which aren't hashable, are compared one by one
+    nested = {
+        field
+        for field in fields
+        if isinstance(remote[field], (dict, list)) or isinstance(last_pushed[field], (dict, list))
+    }
+    scalar = fields - nested
+    changed_pairs = {(field, remote[field]) for field in scalar} ^ {
+        (field, last_pushed[field]) for field in scalar
+    }
+
+    remotely_modified = {field for field, _ in changed_pairs}
+    remotely_modified.update(field for field in nested if remote[field] != last_pushed[field])
+    modifications = {field: (remote[field], last_pushed[field]) for field in remotely_modified}
 
     return remotely_modified, modifications
 
@@ -389,19 +844,12 @@ def filter_update_data(
         - Filtered data dict (excluding remotely modified fields)
         - Set of fields that were skipped
     """
-    skipped = set()
-    filtered = {}
-
-    for key, value in local_data.items():
-        if key == "id":
-            # Never include 'id' in updates
-            continue
-
-        if key in remotely_modified_fields:
-            skipped.add(key)
-            continue
-
-        filtered[key] = value
+    filtered = {
+        key: value
+        for key, value in local_data.items()
+        if key not in READ_ONLY_FIELDS and key not in remotely_modified_fields
+    }
+    skipped = (local_data.keys() & remotely_modified_fields) - READ_ONLY_FIELDS
 
     return filtered, skipped
 
@@ -411,16 +859,62 @@ def filter_update_data(
 # =============================================================================
 
 
+# Leading bytes of a document that is probably a JSON object
+_JSON_OBJECT_START = re.compile(rb"\s*\{")
+
+# Bytes that JSON and YAML read differently even in a valid JSON document: the
+# NEL, LS and PS line breaks (folded inside YAML strings, kept by JSON) and
+# UTF-16 surrogate escapes (decoded by JSON, rejected by LibYAML)
+_JSON_YAML_MISMATCH = re.compile(rb"\xc2\x85|\xe2\x80[\xa8\xa9]|\\u[dD][89a-fA-F]")
+
+
+def _contains_float(value: Any) -> bool:
+    """Return True if a parsed JSON value holds a float anywhere inside it."""
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_float(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_float(v) for v in value)
+    return False
+
+
+def _parse_document(raw: Union[bytes, mmap.mmap]) -> Any:
+    """Parse a challenge document held in bytes or a read-only memory map."""
+    # JSON is (almost entirely) a subset of YAML and far quicker to parse, so
+    # files written as a JSON object skip the YAML parser. YAML stays the
+    # reference: documents the two would read differently (see
+    # _JSON_YAML_MISMATCH) go through YAML, as do documents containing floats,
+    # since YAML 1.1 reads e.g. 1e3 as a string, not a float
+    if _JSON_OBJECT_START.match(raw) and not _JSON_YAML_MISMATCH.search(raw):
+        try:
+            with memoryview(raw) as view:
+                data = _json_loads(view)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if not _contains_float(data):
+                return data
+
+    try:
+        return yaml.load(raw, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ValidationError(f"Invalid YAML syntax: {e}")
+
+
 def load_yaml_file(path: Path) -> Dict:
     """Load and parse a YAML file."""
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValidationError(f"Invalid YAML syntax: {e}")
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            data = _parse_document(f.read())
+        else:
+            # Map large files rather than copying them into memory; LibYAML
+            # then reads through the mapping in chunks
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = _parse_document(mapped)
 
     if not isinstance(data, dict):
         raise ValidationError("YAML file must contain a mapping/object at the root")
@@ -428,7 +922,140 @@ def load_yaml_file(path: Path) -> Dict:
     return data
 
 
-def sync_challenge(yaml_path: Path, dry_run: bool = False, force: bool = False) -> None:
+def load_and_validate(path: Path) -> Tuple[Dict, List[str]]:
+    """
+    Load a challenge YAML file and validate it against the JSON Schema.
+
+    This is the single-file counterpart of loading a batch of files and
+    checking them with validate_many().
+
+    Returns:
+        Tuple of (parsed data, list of validation errors)
+    """
+    data = load_yaml_file(path)
+    return data, validate_challenge_yaml(data)
+
+
+def get_source_mtime_ns(path: Path) -> Optional[int]:
+    """Get the modification time of a challenge file, or None if it can't be read."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def fetch_remote_challenge(
+    client: CTFdAPIClient, challenge_name: str, challenge_id: Optional[int] = None
+) -> Optional[Dict]:
+    """
+    Fetch the full remote state of a challenge, or None if it doesn't exist.
+
+    When the challenge ID is known from the last push, the challenge is fetched
+    directly, saving the lookup by name. The lookup is still used if that
+    challenge has since been deleted or renamed on CTFd.
+    """
+    if challenge_id is not None:
+        try:
+            remote_state = client.get_challenge_by_id(challenge_id)
+        except APIError as e:
+            if e.status_code != 404:
+                raise
+        else:
+            if remote_state.get("name") == challenge_name:
+                return remote_state
+
+    existing = client.find_challenge_by_name(challenge_name)
+    if existing is None:
+        return None
+    return client.get_challenge_by_id(existing["id"])
+
+
+def connect_from_config(log: Callable[[str], None] = print) -> CTFdAPIClient:
+    """Create an API client from the environment configuration."""
+    # Check configuration
+    ctfd_url, api_token = get_config()
+    if not api_token:
+        log("\nError: CTFD_API_TOKEN is not set.")
+        log("Generate an API token in the CTFd admin panel and set it as an environment variable.")
+        sys.exit(1)
+
+    # Connect to API
+    log(f"\nConnecting to {ctfd_url}...")
+    return CTFdAPIClient(ctfd_url, api_token)
+
+
+def fetch_push_state(
+    client: CTFdAPIClient, yaml_path: Path, challenge_name: str, log: Callable[[str], None] = print
+) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Load a challenge's last pushed state and fetch its current remote state.
+
+    Returns:
+        Tuple of (last pushed state, remote state), either of which may be None
+    """
+    last_pushed_state = load_last_pushed_state(yaml_path, challenge_name, log)
+    known_id = last_pushed_state.get("id") if last_pushed_state else None
+    return last_pushed_state, fetch_remote_challenge(client, challenge_name, known_id)
+
+
+def is_cached_push_current(
+    client: CTFdAPIClient,
+    cached: Dict,
+    last_pushed_state: Optional[Dict],
+    remote_state: Optional[Dict],
+) -> bool:
+    """
+    Check, without loading the file, whether a cached push is still current.
+
+    The challenge must still exist on CTFd, unmodified since the last push,
+    and the last push must have been of this data to this CTFd instance.
+    """
+    if remote_state is None:
+        return False
+    if not is_pushed_state_current(last_pushed_state, cached.get("hash"), client.base_url):
+        return False
+
+    local_fields = dict.fromkeys(cached.get("fields", ()))
+    remotely_modified, _ = detect_remotely_modified_fields(
+        remote_state, last_pushed_state, local_fields
+    )
+    return not remotely_modified
+
+
+def load_checked_challenge(
+    yaml_path: Path,
+    checked: Optional[Tuple[Dict, List[str]]] = None,
+    log: Callable[[str], None] = print,
+) -> Dict:
+    """
+    Load a challenge file and validate it, unless that was already done.
+
+    Raises:
+        ValidationError: If the challenge does not match the JSON Schema
+    """
+    log(f"Loading {yaml_path}...")
+    data, errors = load_and_validate(yaml_path) if checked is None else checked
+
+    log("Validating against JSON Schema...")
+    if errors:
+        log("Validation failed:")
+        for error in errors:
+            log(f"  - {error}")
+        raise ValidationError("Challenge does not match the JSON Schema")
+
+    log("Validation passed!")
+    return data
+
+
+def sync_challenge(
+    yaml_path: Path,
+    dry_run: bool = False,
+    force: bool = False,
+    client: Optional[CTFdAPIClient] = None,
+    log: Callable[[str], None] = print,
+    checked: Optional[Tuple[Dict, List[str]]] = None,
+    source_mtime_ns: Optional[int] = None,
+) -> None:
     """
     Sync a challenge from a YAML file to CTFd.
 
@@ -436,61 +1063,109 @@ def sync_challenge(yaml_path: Path, dry_run: bool = False, force: bool = False)
         yaml_path: Path to the challenge YAML file
         dry_run: If True, validate only without making API calls
         force: If True, overwrite remotely modified fields
+        client: API client to use (created from the configuration if omitted)
+        log: Callable used to emit progress messages
+        checked: Data and validation errors already computed for the file
+        source_mtime_ns: Modification time of the file before it was checked
     """
-    # Load and validate YAML
-    print(f"Loading {yaml_path}...")
-    data = load_yaml_file(yaml_path)
-
-    print("Validating against JSON Schema...")
-    errors = validate_challenge_yaml(data)
-    if errors:
-        print("Validation failed:")
-        for error in errors:
-            print(f"  - {error}")
-        sys.exit(1)
-
-    print("Validation passed!")
+    if checked is None:
+        # Taken before loading, so an edit made during the sync is seen next time
+        source_mtime_ns = get_source_mtime_ns(yaml_path)
+
+        # A file untouched since its last full push only needs CTFd checked
+        cached = None if force or dry_run else load_sync_cache(yaml_path, source_mtime_ns)
+        if cached is not None:
+            if client is None:
+                client = connect_from_config(log)
+
+            # The name lock is held from the check through the push, so the
+            # remote state fetched for the check is still current when reused
+            with client.lock_name(cached["name"]):
+                push_state = fetch_push_state(client, yaml_path, cached["name"], log)
+                if is_cached_push_current(client, cached, *push_state):
+                    log(
+                        f"Skipping {yaml_path}: unchanged since the last push. "
+                        "Use --force to sync anyway."
+                    )
+                    return
+
+                data = load_checked_challenge(yaml_path, log=log)
+                if data["name"] == cached["name"]:
+                    push_challenge(client, yaml_path, data, force, log, source_mtime_ns, push_state)
+                    return
+
+            # The cache entry was for another challenge name, so the state
+            # fetched above doesn't apply
+            with client.lock_name(data["name"]):
+                push_challenge(client, yaml_path, data, force, log, source_mtime_ns)
+            return
+
+    data = load_checked_challenge(yaml_path, checked, log)
 
     if dry_run:
-        print("\nDry run mode - no changes made.")
-        print(f"Would sync challenge: {data.get('name')}")
+        log("\nDry run mode - no changes made.")
+        log(f"Would sync challenge: {data.get('name')}")
         return
 
-    # Check configuration
-    if not CTFD_API_TOKEN:
-        print("\nError: CTFD_API_TOKEN is not set.")
-        print("Generate an API token in the CTFd admin panel and set it as an environment variable.")
-        sys.exit(1)
+    if client is None:
+        client = connect_from_config(log)
 
-    # Connect to API
-    print(f"\nConnecting to {CTFD_URL}...")
-    client = CTFdAPIClient(CTFD_URL, CTFD_API_TOKEN)
+    # Files with the same challenge name are synced one at a time, so only
+    # the first creates it
+    with client.lock_name(data["name"]):
+        push_challenge(client, yaml_path, data, force, log, source_mtime_ns)
 
-    # Check if challenge exists
+
+def push_challenge(
+    client: CTFdAPIClient,
+    yaml_path: Path,
+    data: Dict,
+    force: bool = False,
+    log: Callable[[str], None] = print,
+    source_mtime_ns: Optional[int] = None,
+    push_state: Optional[Tuple[Optional[Dict], Optional[Dict]]] = None,
+) -> None:
+    """
+    Create or update a validated challenge on CTFd.
+
+    The caller must hold client.lock_name() for the challenge name.
+
+    Args:
+        client: API client to use
+        yaml_path: Path to the challenge YAML file
+        data: Validated challenge data
+        force: If True, overwrite remotely modified fields
+        log: Callable used to emit progress messages
+        source_mtime_ns: Modification time of the file before it was loaded
+        push_state: Last pushed and remote state from fetch_push_state(), if
+            already fetched under the same lock
+    """
     challenge_name = data["name"]
-    print(f"Looking for existing challenge: {challenge_name}...")
 
-    existing = client.find_challenge_by_name(challenge_name)
+    # Check if challenge exists
+    log(f"Looking for existing challenge: {challenge_name}...")
 
-    if existing:
-        # Update existing challenge
-        challenge_id = existing["id"]
-        print(f"Found existing challenge (ID: {challenge_id}). Updating...")
+    # Load last pushed state, which also records the challenge ID and a hash of
+    # the pushed local data, and fetch full remote state for comparison
+    if push_state is None:
+        push_state = fetch_push_state(client, yaml_path, challenge_name, log)
+    last_pushed_state, remote_state = push_state
+    local_hash = compute_content_hash(data)
 
-        # Fetch full remote state for comparison
-        remote_state = client.get_challenge_by_id(challenge_id)
+    if remote_state:
+        # Update existing challenge
+        challenge_id = remote_state["id"]
+        log(f"Found existing challenge (ID: {challenge_id}). Updating...")
 
         if force:
-            print("  Force mode enabled - will overwrite all fields including remote modifications.")
+            log("  Force mode enabled - will overwrite all fields including remote modifications.")
             remotely_modified = set()
             modifications = {}
         else:
-            # Load last pushed state
-            last_pushed_state = load_last_pushed_state(yaml_path, challenge_name)
             if last_pushed_state is None:
-                print("  No previous sync state found - will update all fields.")
+                log("  No previous sync state found - will update all fields.")
             else:
-                print("  Found previous sync state - checking for remote modifications...")
+                log("  Found previous sync state - checking for remote modifications...")
 
             # Detect remotely modified fields
             remotely_modified, modifications = detect_remotely_modified_fields(
@@ -498,51 +1173,187 @@ def sync_challenge(yaml_path: Path, dry_run: bool = False, force: bool = False)
             )
 
             if remotely_modified:
-                print(f"  Detected {len(remotely_modified)} field(s) modified remotely:")
-                for field in sorted(remotely_modified):
-                    remote_val, last_val = modifications[field]
-                    print(f"    - {field}: was '{last_val}' at last push, now '{remote_val}' on CTFd")
-                print("  These fields will NOT be overwritten. Use --force to override.")
+                log(f"  Detected {len(remotely_modified)} field(s) modified remotely:")
+                for field, (remote_val, last_val) in sorted(modifications.items()):
+                    log(f"    - {field}: was '{last_val}' at last push, now '{remote_val}' on CTFd")
+                log("  These fields will NOT be overwritten. Use --force to override.")
+            elif is_pushed_state_current(last_pushed_state, local_hash, client.base_url):
+                log("  Local challenge is unchanged since the last push - skipping update.")
+                save_sync_cache(yaml_path, source_mtime_ns, data, local_hash)
+                return
 
         # Filter update data to exclude remotely modified fields
         update_data, skipped_fields = filter_update_data(data, remotely_modified)
 
         if not update_data:
-            print("  No fields to update (all fields were either remotely modified or unchanged).")
+            log("  No fields to update (all fields were either remotely modified or unchanged).")
         else:
-            fields_to_update = [k for k in update_data.keys() if k != "name"]
+            # Only send fields whose value differs from CTFd's (the name is
+            # always sent). Fields CTFd doesn't return, like requirements,
+            # can't be compared and are always sent.
+            changed_data = {
+                k: v
+                for k, v in update_data.items()
+                if k == "name"
+                or k not in remote_state
+                or normalize_value(v) != normalize_value(remote_state[k])
+            }
+            fields_to_update = sorted(changed_data.keys() - {"name"})
             if fields_to_update:
-                print(f"  Updating fields: {', '.join(sorted(fields_to_update))}")
-
-            result = client.update_challenge(challenge_id, update_data)
-            print(f"Successfully updated challenge: {result.get('name')} (ID: {result.get('id')})")
+                log(f"  Updating fields: {', '.join(fields_to_update)}")
+                result = client.update_challenge(challenge_id, changed_data)
+                log(
+                    f"Successfully updated challenge: {result.get('name')} (ID: {result.get('id')})"
+                )
+            else:
+                log("  All fields already match CTFd - nothing to update.")
 
             # Save the new state (merge local data with remote for non-updated fields)
+            # The hash is only recorded when every local field was pushed, so
+            # skipped fields are retried on the next sync
             new_state = dict(remote_state)
             new_state.update(update_data)
-            save_pushed_state(yaml_path, challenge_name, new_state)
-            print(f"  Saved sync state to {get_state_file_path(yaml_path, challenge_name)}")
+            save_pushed_state(
+                yaml_path,
+                challenge_name,
+                new_state,
+                None if skipped_fields else local_hash,
+                client.base_url,
+            )
+            log(f"  Saved sync state to {get_state_file_path(yaml_path, challenge_name)}")
+            if not skipped_fields:
+                save_sync_cache(yaml_path, source_mtime_ns, data, local_hash)
     else:
         # Create new challenge
-        print("Challenge not found. Creating new challenge...")
+        log("Challenge not found. Creating new challenge...")
         result = client.create_challenge(data)
-        print(f"Successfully created challenge: {result.get('name')} (ID: {result.get('id')})")
+        log(f"Successfully created challenge: {result.get('name')} (ID: {result.get('id')})")
 
         # Save initial state
-        save_pushed_state(yaml_path, challenge_name, result)
-        print(f"  Saved sync state to {get_state_file_path(yaml_path, challenge_name)}")
+        save_pushed_state(yaml_path, challenge_name, result, local_hash, client.base_url)
+        log(f"  Saved sync state to {get_state_file_path(yaml_path, challenge_name)}")
+        save_sync_cache(yaml_path, source_mtime_ns, data, local_hash)
+
+
+def run_sync(
+    yaml_path: Path,
+    dry_run: bool = False,
+    force: bool = False,
+    client: Optional[CTFdAPIClient] = None,
+    log: Callable[[str], None] = print,
+    checked: Optional[Tuple[Dict, List[str]]] = None,
+    source_mtime_ns: Optional[int] = None,
+) -> bool:
+    """
+    Sync a challenge, reporting any error through `log` instead of raising.
 
+    Returns:
+        True if the challenge was synced (or validated, in dry-run mode)
+    """
+    try:
+        sync_challenge(
+            yaml_path,
+            dry_run=dry_run,
+            force=force,
+            client=client,
+            log=log,
+            checked=checked,
+            source_mtime_ns=source_mtime_ns,
+        )
+    except FileNotFoundError as e:
+        log(f"Error: {e}")
+    except ValidationError as e:
+        log(f"Validation error: {e}")
+    except Exception as e:
+        # Only reached on failure, so this import costs nothing on success
+        import requests
 
-def main():
-    global CTFD_URL, CTFD_API_TOKEN
+        if isinstance(e, requests.exceptions.ConnectionError):
+            ctfd_url = client.base_url if client is not None else get_config()[0]
+            log(f"Error: Could not connect to {ctfd_url}")
+            log("Make sure CTFd is running and the URL is correct.")
+        else:
+            log(f"Error: {e}")
+    else:
+        return True
+    return False
+
+
+def sync_challenges(
+    yaml_paths: List[Path],
+    dry_run: bool = False,
+    force: bool = False,
+    client: Optional[CTFdAPIClient] = None,
+    jobs: int = SYNC_WORKERS,
+    quiet: bool = False,
+) -> int:
+    """
+    Sync several challenge YAML files to CTFd concurrently.
+
+    All files are loaded and validated as one batch before syncing starts.
+    Each challenge's progress messages are buffered and written as one block,
+    in the order the paths were given, so concurrent syncs don't interleave.
+
+    Args:
+        yaml_paths: Paths to the challenge YAML files
+        dry_run: If True, validate only without making API calls
+        force: If True, overwrite remotely modified fields
+        client: API client to share between challenges
+        jobs: Number of challenges to sync concurrently
+        quiet: If True, only write the messages of challenges that failed
+
+    Returns:
+        Number of challenges that failed to sync
+    """
+    loaded = {}
+    mtimes = {}
+    for yaml_path in yaml_paths:
+        mtime_ns = get_source_mtime_ns(yaml_path)
+        if not (force or dry_run) and load_sync_cache(yaml_path, mtime_ns) is not None:
+            # Checked against CTFd by sync_challenge() before it loads the file
+            continue
+        mtimes[yaml_path] = mtime_ns
+        try:
+            loaded[yaml_path] = load_yaml_file(yaml_path)
+        except Exception:
+            # Loaded again, and the error reported, when the file is synced
+            pass
+    checked = dict(zip(loaded, zip(loaded.values(), validate_many(list(loaded.values())))))
+
+    def run(yaml_path: Path) -> Tuple[bool, List[str]]:
+        lines = []
+        ok = run_sync(
+            yaml_path,
+            dry_run=dry_run,
+            force=force,
+            client=client,
+            log=lines.append,
+            checked=checked.get(yaml_path),
+            source_mtime_ns=mtimes.get(yaml_path),
+        )
+        return ok, lines
 
+    failures = 0
+    workers = max(1, min(jobs, len(yaml_paths), HTTP_POOL_SIZE))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for ok, lines in executor.map(run, yaml_paths):
+            if not ok:
+                failures += 1
+            elif quiet:
+                continue
+            sys.stdout.write("\n".join(lines) + "\n\n")
+    return failures
+
+
+def main():
     parser = argparse.ArgumentParser(
-        description="Sync a challenge YAML file to CTFd",
+        description="Sync challenge YAML files to CTFd",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   python sync_challenge.py challenges/web/sqli.yaml
   python sync_challenge.py --dry-run challenges/crypto/rsa.yaml
+  python sync_challenge.py --jobs 4 challenges/*/*.yaml
 
 Environment variables:
   CTFD_URL         Base URL of CTFd (default: http://localhost:4000)
@@ -550,9 +1361,11 @@ Environment variables:
         """,
     )
     parser.add_argument(
-        "yaml_file",
+        "yaml_files",
         type=Path,
-        help="Path to the challenge YAML file",
+        nargs="+",
+        metavar="yaml_file",
+        help="Path to a challenge YAML file (several may be given)",
     )
     parser.add_argument(
         "--dry-run",
@@ -562,7 +1375,25 @@ Environment variables:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Overwrite remotely modified fields (ignores remote changes)",
+        help=(
+            "Overwrite remotely modified fields (ignores remote changes), "
+            "and sync challenges that are unchanged since the last push"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=SYNC_WORKERS,
+        help=(
+            f"Number of challenges to sync concurrently "
+            f"(default: {SYNC_WORKERS}, max: {HTTP_POOL_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only print messages for challenges that fail to sync",
     )
     parser.add_argument(
         "--url",
@@ -579,26 +1410,40 @@ Environment variables:
 
     args = parser.parse_args()
 
-    # Override config from command line args
-    if args.url:
-        CTFD_URL = args.url
-    if args.token:
-        CTFD_API_TOKEN = args.token
+    # Command line args override the environment
+    ctfd_url, api_token = get_config()
+    ctfd_url = args.url or ctfd_url
+    api_token = args.token or api_token
+
+    # A single client (and connection pool) is shared by every challenge
+    client = None
+    if not args.dry_run:
+        if not api_token:
+            print("Error: CTFD_API_TOKEN is not set.")
+            print("Generate an API token in the CTFd admin panel and set it as an environment variable.")
+            sys.exit(1)
+        if not args.quiet:
+            print(f"Connecting to {ctfd_url}...\n")
+        # With several files, look challenges up by name from a single listing
+        client = CTFdAPIClient(ctfd_url, api_token, index_names=len(args.yaml_files) > 1)
+
+    if len(args.yaml_files) == 1 and not args.quiet:
+        # Stream progress as it happens when syncing a single challenge
+        ok = run_sync(args.yaml_files[0], dry_run=args.dry_run, force=args.force, client=client)
+        failures = 0 if ok else 1
+    else:
+        failures = sync_challenges(
+            args.yaml_files,
+            dry_run=args.dry_run,
+            force=args.force,
+            client=client,
+            jobs=args.jobs,
+            quiet=args.quiet,
+        )
+        if len(args.yaml_files) > 1:
+            print(f"{len(args.yaml_files) - failures}/{len(args.yaml_files)} challenge(s) synced.")
 
-    try:
-        sync_challenge(args.yaml_file, dry_run=args.dry_run, force=args.force)
-    except FileNotFoundError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except ValidationError as e:
-        print(f"Validation error: {e}")
-        sys.exit(1)
-    except requests.exceptions.ConnectionError:
-        print(f"Error: Could not connect to {CTFD_URL}")
-        print("Make sure CTFd is running and the URL is correct.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}")
+    if failures:
         sys.exit(1)
 
 
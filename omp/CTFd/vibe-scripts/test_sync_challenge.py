@@ -0,0 +1,245 @@
+"""Tests for sync_challenge.py."""
+
+import os
+import threading
+
+import pytest
+import yaml
+
+import sync_challenge
+
+# =============================================================================
+# DOCUMENT PARSING
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"name": "Intro", "category": "web", "value": 100}',
+        '{"name": "x\\/y", "value": 1, "value": 2}',
+        '{"requirements": {"prerequisites": [1, 2], "anonymize": true}, "next_id": null}',
+        '{"name": "café", "description": "\\u2028"}',
+        '{"value": 1e3}',
+        '{"value": 1.5, "name": "float"}',
+        '{"description": "é \u2028 z"}',
+        '{"description": "é \u2029 z"}',
+        '{"description": "é \u0085 z"}',
+        '{"description": "\\ud83d\\ude00"}',
+        '{"description": "tab\there"}',
+        "{name: flow, value: 1}",
+    ],
+)
+def test_parse_document_matches_yaml(document):
+    """JSON-shaped documents parse exactly as the YAML parser would read them."""
+    raw = document.encode("utf-8")
+    try:
+        expected = yaml.load(raw, Loader=sync_challenge._SafeLoader)
+    except yaml.YAMLError:
+        with pytest.raises(sync_challenge.ValidationError):
+            sync_challenge._parse_document(raw)
+    else:
+        assert sync_challenge._parse_document(raw) == expected
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+VALID_CHALLENGE = {"name": "Intro", "category": "web", "value": 100}
+
+
+def test_validate_reports_yaml_only_types():
+    """Values with no JSON type, like dates, get the schema error, not a crash."""
+    data = yaml.load("name: 2024-01-01\ncategory: web\nvalue: 100\n", Loader=yaml.SafeLoader)
+
+    errors = sync_challenge.validate_challenge_yaml(data)
+
+    assert errors == ["name: datetime.date(2024, 1, 1) is not of type 'string'"]
+
+
+def test_validate_many_reports_yaml_only_types():
+    """A date in one file of a batch is reported for that file only."""
+    bad = dict(VALID_CHALLENGE, name=yaml.safe_load("2024-01-01"))
+
+    errors = sync_challenge.validate_many([VALID_CHALLENGE, bad])
+
+    assert errors == [[], ["name: datetime.date(2024, 1, 1) is not of type 'string'"]]
+
+
+# =============================================================================
+# API CLIENT
+# =============================================================================
+
+
+def test_post_is_only_retried_when_throttled():
+    """POST is replayed after a 429 or a 503 with Retry-After, never after other errors."""
+    client = sync_challenge.CTFdAPIClient("http://ctfd.invalid", "token")
+    retry = client.session.get_adapter("http://ctfd.invalid").max_retries
+
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("POST", 503, has_retry_after=True)
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 500)
+    assert not retry.is_retry("POST", 502, has_retry_after=True)
+    assert retry.is_retry("PATCH", 500)
+    assert retry.is_retry("GET", 503)
+
+
+# =============================================================================
+# STATE TRACKING
+# =============================================================================
+
+
+def test_pushed_state_records_instance_without_its_url(tmp_path):
+    """The state file identifies the CTFd instance, but never contains its URL."""
+    yaml_path = tmp_path / "challenge.yaml"
+    url = "https://ctfd.example.org"
+    sync_challenge.save_pushed_state(yaml_path, "Intro", dict(VALID_CHALLENGE, id=1), "h", url)
+
+    state_file = sync_challenge.get_state_file_path(yaml_path, "Intro")
+    assert "ctfd.example.org" not in state_file.read_text()
+
+    state = sync_challenge.load_last_pushed_state(yaml_path, "Intro")
+    assert sync_challenge.is_pushed_state_current(state, "h", url)
+    assert not sync_challenge.is_pushed_state_current(state, "h", "https://other.example.org")
+    assert not sync_challenge.is_pushed_state_current(state, "other", url)
+
+
+# =============================================================================
+# SKIP DECISIONS
+# =============================================================================
+
+
+class FakeCTFd:
+    """In-memory stand-in for CTFdAPIClient that records every request."""
+
+    def __init__(self, base_url: str = "http://ctfd.test"):
+        self.base_url = base_url
+        self.challenges = {}
+        self.requests = []
+        self._name_locks = {}
+
+    def lock_name(self, name):
+        return self._name_locks.setdefault(name, threading.Lock())
+
+    def get_challenge_by_id(self, challenge_id):
+        self.requests.append(("GET", challenge_id))
+        if challenge_id not in self.challenges:
+            raise sync_challenge.APIError(404, "Not found")
+        # Like CTFd, challenge reads don't include requirements
+        challenge = dict(self.challenges[challenge_id])
+        challenge.pop("requirements", None)
+        return challenge
+
+    def find_challenge_by_name(self, name):
+        self.requests.append(("FIND", name))
+        return next((c for c in self.challenges.values() if c["name"] == name), None)
+
+    def create_challenge(self, data):
+        self.requests.append(("POST", data["name"]))
+        challenge_id = max(self.challenges, default=0) + 1
+        self.challenges[challenge_id] = dict(data, id=challenge_id)
+        return dict(self.challenges[challenge_id])
+
+    def update_challenge(self, challenge_id, data):
+        self.requests.append(("PATCH", challenge_id, sorted(data)))
+        self.challenges[challenge_id].update(data)
+        return dict(self.challenges[challenge_id])
+
+
+def write_challenge(path, mtime_ns, **fields):
+    """Write a challenge file with a fixed modification time."""
+    path.write_text(yaml.safe_dump(dict(VALID_CHALLENGE, **fields)))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def sync(path, client, force=False):
+    """Sync a file and return (requests made, messages logged)."""
+    client.requests.clear()
+    messages = []
+    sync_challenge.sync_challenge(path, force=force, client=client, log=messages.append)
+    return client.requests, messages
+
+
+@pytest.fixture
+def pushed(tmp_path):
+    """A challenge file that has been pushed once, and the CTFd it went to."""
+    path = tmp_path / "challenge.yaml"
+    write_challenge(path, 1_000_000_000)
+    client = FakeCTFd()
+    requests, _ = sync(path, client)
+    assert requests == [("FIND", "Intro"), ("POST", "Intro")]
+    return path, client
+
+
+def test_untouched_file_is_skipped_after_checking_ctfd(pushed):
+    path, client = pushed
+
+    requests, messages = sync(path, client)
+
+    assert requests == [("GET", 1)]
+    assert any(m.startswith("Skipping") for m in messages)
+    assert not any(m.startswith("Loading") for m in messages)
+
+
+def test_touched_file_is_loaded_but_not_pushed(pushed):
+    path, client = pushed
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    requests, messages = sync(path, client)
+
+    assert requests == [("GET", 1)]
+    assert any("skipping update" in m for m in messages)
+    # The new mtime was cached, so the next sync skips the file unloaded
+    _, messages = sync(path, client)
+    assert any(m.startswith("Skipping") for m in messages)
+
+
+def test_edited_file_is_pushed(pushed):
+    path, client = pushed
+    write_challenge(path, 2_000_000_000, value=200)
+
+    requests, _ = sync(path, client)
+
+    assert requests == [("GET", 1), ("PATCH", 1, ["name", "value"])]
+    assert client.challenges[1]["value"] == 200
+
+
+def test_deleted_challenge_is_recreated_with_one_lookup(pushed):
+    path, client = pushed
+    del client.challenges[1]
+
+    requests, _ = sync(path, client)
+
+    assert requests == [("GET", 1), ("FIND", "Intro"), ("POST", "Intro")]
+
+
+def test_remote_modification_is_kept(pushed):
+    path, client = pushed
+    client.challenges[1]["category"] = "pwn"
+
+    requests, messages = sync(path, client)
+
+    assert requests == [("GET", 1)]
+    assert any("modified remotely" in m for m in messages)
+    assert client.challenges[1]["category"] == "pwn"
+
+
+def test_other_ctfd_instance_is_synced(pushed):
+    path, _ = pushed
+    other = FakeCTFd("http://other.test")
+
+    requests, _ = sync(path, other)
+
+    assert requests == [("GET", 1), ("FIND", "Intro"), ("POST", "Intro")]
+
+
+def test_force_overwrites_remote_modification_of_untouched_file(pushed):
+    path, client = pushed
+    client.challenges[1]["category"] = "pwn"
+
+    requests, _ = sync(path, client, force=True)
+
+    assert requests == [("GET", 1), ("PATCH", 1, ["category", "name"])]
+    assert client.challenges[1]["category"] == "web"